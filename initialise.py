@@ -2,11 +2,33 @@
 """Project setup script that initialises a Python project."""
 
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+SKIP_DIRS = frozenset(
+    {
+        "__pycache__",
+        "node_modules",
+        "dist",
+        "build",
+        "target",
+        ".git",
+        ".venv",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+    }
+)
+BINARY_SUFFIXES = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".ico", ".pyc", ".whl", ".so", ".zip", ".gz"}
+)
+
 
 def check_uv_installed() -> str:
     """Check if uv is installed and return its path."""
@@ -20,13 +42,39 @@ def check_uv_installed() -> str:
     return uv_path
 
 
-def initialise_precommit(uv_path: str) -> None:
-    """Install pre-commit and initialise hooks using the provided uv executable path."""
-    subprocess.run(
-        [uv_path, "run", "pre-commit", "install"], check=True, capture_output=True
-    )
+def initialise_git_repository(git_path: str) -> bool:
+    """Initialize a local Git repository unless there is one, and report if it did."""
+    if Path(".git").exists():
+        print("Git repository already initialized.")
+        return False
+    subprocess.run([git_path, "init"], check=True)
+    print("Initialized empty Git repository.")
+    return True
+
+
+def install_precommit(uv_path: str) -> str:
+    """Install pre-commit hooks in the project environment, return the tool used."""
+    # Prefer prek, which sets up hook environments in parallel.
+    hook_runner = "prek"
+    try:
+        subprocess.run(
+            [uv_path, "run", hook_runner, "install"], check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError as e:
+        # Fall back only if prek is missing from the project, not on any other error.
+        if f"Failed to spawn: `{hook_runner}`".encode() not in e.stderr:
+            raise
+        hook_runner = "pre-commit"
+        subprocess.run(
+            [uv_path, "run", hook_runner, "install"], check=True, capture_output=True
+        )
+    return hook_runner
+
+
+def run_precommit(uv_path: str, hook_runner: str) -> None:
+    """Run pre-commit hooks on all files with the tool that installed them."""
     subprocess.run(
-        [uv_path, "run", "pre-commit", "run", "--all-files"],
+        [uv_path, "run", hook_runner, "run", "--all-files"],
         check=True,
         capture_output=True,
     )
@@ -45,6 +93,82 @@ def get_user_input() -> tuple[str, str, str]:
     return project_name, description, python_version
 
 
+def _gather_paths() -> list[str]:
+    """Collect paths of all files that may contain variables placeholders."""
+    # Skip the script itself.
+    script_name = Path(__file__).name
+    paths = []
+    # Directory entries cache their type, so no extra stat call is needed per file.
+    stack = ["."]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Skip directories that cannot be read.
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip hidden, cache and build directories.
+                    if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name != script_name:
+                    paths.append(entry.path)
+    return paths
+
+
+def _is_candidate_file(path: Path, max_bytes: int = 2_000_000) -> bool:
+    """Check cheaply, without reading it, if the file may be a small text file."""
+    if path.suffix.lower() in BINARY_SUFFIXES:
+        return False
+    return path.stat().st_size <= max_bytes
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """Write the content through a temporary file, so the file is never partial."""
+    # A unique name, so that no other file in the project gets overwritten.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        shutil.copymode(path, tmp_path)
+        tmp_path.replace(path)
+    except BaseException:
+        # Do not leave the temporary file behind, even on KeyboardInterrupt.
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _process_file(
+    file_path: str,
+    pattern: re.Pattern[bytes],
+    replacements: dict[bytes, bytes],
+    sentinels: tuple[bytes, ...],
+) -> bool:
+    """Replace variables placeholders in a single file and report if it changed."""
+    path = Path(file_path)
+    try:
+        if not _is_candidate_file(path):
+            return False
+        # Placeholders are ASCII, so the raw bytes are edited without decoding them.
+        content = path.read_bytes()
+        if b"\x00" in content[:4096]:
+            # Skip binary files.
+            return False
+        if not any(sentinel in content for sentinel in sentinels):
+            # Skip files without placeholders before running the regex engine.
+            return False
+        new_content = pattern.sub(lambda match: replacements[match.group(0)], content)
+        if new_content != content:
+            _write_atomically(path, new_content)
+            return True
+    except OSError:
+        # Skip files that cannot be read.
+        pass
+    return False
+
+
 def replace_variables(project_name: str, description: str, python_version: str) -> None:
     """Replace variables placeholders in all files."""
     replacements = {
@@ -53,33 +177,56 @@ def replace_variables(project_name: str, description: str, python_version: str)
         "3.11": python_version,
         "py311": f"py{python_version.replace('.', '')}",
     }
+    replacements_bytes = {
+        var.encode(): val.encode() for var, val in replacements.items()
+    }
 
-    for root, dirs, files in os.walk("."):
-        # Skip .venv and other directories if needed.
-        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
-
-        for file in files:
-            # Skip the script itself.
-            if file == Path(__file__).name:
-                continue
-
-            path = Path(root) / file
-            try:
-                content = path.read_text(encoding="utf-8")
-                new_content = content
-                for var, val in replacements.items():
-                    new_content = new_content.replace(var, val)
-                if new_content != content:
-                    path.write_text(new_content, encoding="utf-8")
-                    print(f"Updated {path}")
-            except (UnicodeDecodeError, OSError):
-                # Skip binary files or files that cannot be read.
-                pass
-
-
-def initialise_github_repository(project_name: str) -> None:
-    """Initialize a local Git repository and create a remote GitHub repository."""
-    git_path = shutil.which("git")
+    # Longest placeholders go first, so that they win over their own prefixes.
+    pattern = re.compile(
+        b"|".join(
+            re.escape(var) for var in sorted(replacements_bytes, key=len, reverse=True)
+        )
+    )
+    # Placeholders containing another one are found through the shorter one.
+    sentinels = tuple(
+        var
+        for var in replacements_bytes
+        if not any(other != var and other in var for other in replacements_bytes)
+    )
+
+    # File processing is I/O-bound, so threads keep several reads/writes in flight.
+    paths = _gather_paths()
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        updated = executor.map(
+            partial(
+                _process_file,
+                pattern=pattern,
+                replacements=replacements_bytes,
+                sentinels=sentinels,
+            ),
+            paths,
+        )
+        for path, was_updated in zip(paths, updated, strict=True):
+            if was_updated:
+                print(f"Updated {os.path.relpath(path)}")
+
+
+def _has_commits(git_path: str) -> bool:
+    """Check if the local Git repository has any commits."""
+    try:
+        subprocess.run(
+            [git_path, "log", "--oneline", "-1"], check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+def initialise_github_repository(
+    project_name: str, git_path: str | None, *, new_repository: bool
+) -> None:
+    """Commit the local Git repository and create a remote GitHub repository."""
     if git_path is None:
         print("Git is not installed. Please install Git to initialize the repository.")
         return
@@ -100,22 +247,8 @@ def initialise_github_repository(project_name: str) -> None:
         )
         return
 
-    # Check if already a git repository.
-    if Path(".git").exists():
-        print("Git repository already initialized.")
-        # Check if there are commits.
-        try:
-            subprocess.run(
-                [git_path, "log", "--oneline", "-1"], check=True, capture_output=True
-            )
-            has_commits = True
-        except subprocess.CalledProcessError:
-            has_commits = False
-    else:
-        # Initialize git repository.
-        subprocess.run([git_path, "init"], check=True)
-        print("Initialized empty Git repository.")
-        has_commits = False
+    # A freshly initialized repository has no commits, so Git is not asked then.
+    has_commits = not new_repository and _has_commits(git_path)
 
     if not has_commits:
         # Add all files.
@@ -159,14 +292,27 @@ def initialise_github_repository(project_name: str) -> None:
 def main() -> None:
     """Run the main setup process."""
     uv_path = check_uv_installed()
+    git_path = shutil.which("git")
     project_name, description, python_version = get_user_input()
-    replace_variables(project_name, description, python_version)
-    initialise_precommit(uv_path)
+
+    # Git does not read the placeholders, so it is set up while they are replaced.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        git_initialisation = (
+            executor.submit(initialise_git_repository, git_path)
+            if git_path is not None
+            else None
+        )
+        replace_variables(project_name, description, python_version)
+    new_repository = git_initialisation is not None and git_initialisation.result()
+
+    # Syncing the project environment for the hooks needs the replaced files.
+    hook_runner = install_precommit(uv_path)
+    run_precommit(uv_path, hook_runner)
 
     # Remove the script itself.
     Path(__file__).unlink()
 
-    initialise_github_repository(project_name)
+    initialise_github_repository(project_name, git_path, new_repository=new_repository)
 
     print("The setup script has been removed.")
     print("Project initialized successfully.")
@@ -1,5 +1,6 @@
 """The configuration module."""
 
+import functools
 import tomllib
 from pathlib import Path
 
@@ -12,13 +13,11 @@ class Configuration(BaseModel):
     project_name: str
 
 
-def load_configuration(
+@functools.cache
+def get_config(
     configuration_file: Path = Path("config.toml"),
 ) -> Configuration:
-    """Load configuration from the configuration file."""
+    """Load configuration from the configuration file on first use."""
     with configuration_file.open("rb") as f:
         settings = tomllib.load(f)
     return Configuration(**settings)
-
-
-config = load_configuration()
@@ -2,16 +2,21 @@
 
 import typer
 
-from src.configuration import config
+from src.configuration import get_config
 
-app = typer.Typer(help=f"CLI for {config.project_name}", no_args_is_help=True)
 
-
-@app.command()
 def main() -> None:
     """Print a greeting."""
-    typer.echo(f"Hello, world! It is {config.project_name}.")
+    typer.echo(f"Hello, world! It is {get_config().project_name}.")
+
+
+def build_app() -> typer.Typer:
+    """Build the Typer application."""
+    config = get_config()
+    app = typer.Typer(help=f"CLI for {config.project_name}", no_args_is_help=True)
+    app.command()(main)
+    return app
 
 
 if __name__ == "__main__":
-    app()
+    build_app()()